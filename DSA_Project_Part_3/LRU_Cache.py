@@ -1,86 +1,612 @@
-import tkinter as tk
-from tkinter import ttk
-from tkinter import messagebox
+import hashlib
+import math
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+from array import array
 
 class Node:
-    def __init__(self, value): 
-        """On this part of the code it create a node with a value and a next value"""
+    def __init__(self, value, expires_at=None):
+        """On this part of the code it create a node with a value, a next and a previous value
+        and the time the node expires at (None means it never expires)"""
         self.value = value
         self.next = None
+        self.prev = None
+        self.expires_at = expires_at
+        self.timer_slot = None
+        self.timer_level = 0
+
+class TimerWheel:
+    """a hierarchical timer wheel, every level has 64 slots and every slot of a level
+    covers 64 slots of the level below it. a node is placed in the lowest level that can
+    hold its deadline and is moved down a level (cascaded) when the wheel gets close to it,
+    so scheduling, cancelling and expiring a node are all O(1) amortized"""
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS
+    SLOT_MASK = SLOTS - 1
+
+    def __init__(self, now, resolution=1.0, levels=4):
+        self.resolution = resolution
+        self.levels = [[set() for _ in range(self.SLOTS)] for _ in range(levels)]
+        self.counts = [0] * levels
+        self.current_tick = int(now // resolution)
+        self.count = 0
+
+    def schedule(self, node):
+        """this function puts a node in the slot of the wheel that matches its expiry time"""
+        self._place(node, max(self._deadline(node), self.current_tick + 1))
+
+    def _deadline(self, node):
+        return -int(-node.expires_at // self.resolution)
+
+    def _place(self, node, deadline):
+        delta = deadline - self.current_tick
+        top = len(self.levels) - 1
+        if delta >= 1 << (self.SLOT_BITS * (top + 1)):
+            # deadlines past the top level are parked in its furthest slot and re-placed when reached
+            deadline = self.current_tick + (1 << (self.SLOT_BITS * (top + 1))) - 1
+        level = 0
+        while level < top and delta >= 1 << (self.SLOT_BITS * (level + 1)):
+            level += 1
+        slot = self.levels[level][(deadline >> (self.SLOT_BITS * level)) & self.SLOT_MASK]
+        slot.add(node)
+        node.timer_slot = slot
+        node.timer_level = level
+        self.counts[level] += 1
+        self.count += 1
+
+    def cancel(self, node):
+        """this function takes a node out of the wheel"""
+        if node.timer_slot is not None:
+            node.timer_slot.discard(node)
+            node.timer_slot = None
+            self.counts[node.timer_level] -= 1
+            self.count -= 1
+
+    def advance(self, now):
+        """this function moves the wheel forward to the time now and returns every node
+        whose expiry time has passed"""
+        target = int(now // self.resolution)
+        expired = []
+        while self.current_tick < target:
+            if self.count == 0:
+                # nothing is scheduled so the empty ticks can be skipped all at once
+                self.current_tick = target
+                break
+            # when the lower levels are empty nothing can happen before the next cascade of
+            # the lowest level that has nodes, so the wheel jumps to the tick before it
+            level = 0
+            while self.counts[level] == 0:
+                level += 1
+            if level > 0:
+                span = 1 << (self.SLOT_BITS * level)
+                self.current_tick = min(target - 1, self.current_tick | (span - 1))
+            self.current_tick += 1
+            tick = self.current_tick
+            for level in range(len(self.levels) - 1, 0, -1):
+                if tick & ((1 << (self.SLOT_BITS * level)) - 1) == 0:
+                    self._cascade(self.levels[level][(tick >> (self.SLOT_BITS * level)) & self.SLOT_MASK])
+            slot = self.levels[0][tick & self.SLOT_MASK]
+            for node in list(slot):
+                self.cancel(node)
+                if node.expires_at <= now:
+                    expired.append(node)
+                else:
+                    self.schedule(node)
+        return expired
+
+    def _cascade(self, slot):
+        # a cascade runs before the level 0 slot of the same tick is handled, so a node due on
+        # this tick is placed in that slot instead of the next one
+        for node in list(slot):
+            self.cancel(node)
+            self._place(node, max(self._deadline(node), self.current_tick))
+
+class DiskTier:
+    """a second tier for values evicted from the cache. every value is appended as a record
+    to a segment file that is read through mmap, and a dictionary keeps the offset of the
+    record of every value. removing a value appends a tombstone record so the file can be
+    loaded again after a restart, and once the dead records take up enough of the file a
+    background thread rewrites it with only the live records (compaction).
+    a record is a header (flag, length of the payload, expiry time) followed by the payload,
+    the payload of a live record is the pickled value and the payload of a tombstone is the
+    key of the value it removes. the expiry time is wall clock time (time.time) so it still
+    holds after a restart.
+    the dictionary is keyed by an 8 byte digest of the pickled value instead of the value, so
+    a value on disk only costs a fixed size key and an offset in memory whatever its size.
+    the pickled value is compared with the record before a value counts as found, so two
+    values with the same digest are never mixed up (the newer one replaces the older one)"""
+    RECORD = struct.Struct('<BId')
+    LIVE = 1
+    DEAD = 0
+    MISSING = object()
+
+    def __init__(self, path, capacity=None, compact_ratio=0.5, compact_min_bytes=1 << 20):
+        self.path = path
+        self.capacity = capacity
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+        self.index = {}
+        self.dead_bytes = 0
+        self.lock = threading.Lock()
+        self.compactor = None
+        self.map = None
+        self.file = open(path, 'a+b')
+        self.end = self.file.seek(0, os.SEEK_END)
+        self._load()
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, value):
+        """this function checks if a value that has not expired is in the file, it does not change it"""
+        payload = self._payload(value)
+        with self.lock:
+            offset = self.index.get(self._key(payload))
+            if offset is None or not self._matches(offset, payload):
+                return False
+            return not self._header(offset)[2] <= time.time()
+
+    @staticmethod
+    def _payload(value):
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _key(payload):
+        return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'little')
+
+    def _load(self):
+        """this function rebuilds the index from the records in the file, a record cut short
+        by a crash is dropped from the end of the file"""
+        offset = 0
+        if self.end > 0:
+            self._remap()
+        while offset + self.RECORD.size <= self.end:
+            flag, length, _ = self.RECORD.unpack_from(self.map, offset)
+            record_end = offset + self.RECORD.size + length
+            if record_end > self.end:
+                break
+            # the keys come from the raw payloads so nothing has to be unpickled
+            payload = self.map[offset + self.RECORD.size:record_end]
+            key = self._key(payload) if flag == self.LIVE else int.from_bytes(payload, 'little')
+            if key in self.index:
+                self.dead_bytes += self._record_size(self.index.pop(key))
+            if flag == self.LIVE:
+                self.index[key] = offset
+            else:
+                self.dead_bytes += record_end - offset
+            offset = record_end
+        if offset < self.end:
+            self._unmap()
+            self.file.truncate(offset)
+            self.end = offset
+
+    def put(self, value, expires_at=None):
+        """this function appends a value to the file, expires_at is None when it never expires"""
+        payload = self._payload(value)
+        key = self._key(payload)
+        with self.lock:
+            if key in self.index:
+                self.dead_bytes += self._record_size(self.index.pop(key))
+            self.index[key] = self._append(self.LIVE, payload, expires_at)
+            if self.capacity is not None and len(self.index) > self.capacity:
+                self._discard(next(iter(self.index)))
+        self._maybe_compact()
+
+    def take(self, value, default=None):
+        """this function removes a value from the file and returns its expiry time (None when it
+        never expires), or default when the value is not in the file. the check and the removal
+        happen under one lock so a compaction running at the same time cannot get in between"""
+        payload = self._payload(value)
+        key = self._key(payload)
+        with self.lock:
+            offset = self.index.get(key)
+            if offset is None or not self._matches(offset, payload):
+                return default
+            _, _, expires_at = self._header(offset)
+            self._discard(key)
+        self._maybe_compact()
+        return None if math.isnan(expires_at) else expires_at
+
+    def close(self):
+        """this function waits for a running compaction and closes the file"""
+        if self.compactor is not None:
+            self.compactor.join()
+        with self.lock:
+            self._unmap()
+            self.file.close()
+
+    def _discard(self, key):
+        offset = self.index.pop(key)
+        self.dead_bytes += self._record_size(offset)
+        tombstone = self._append(self.DEAD, key.to_bytes(8, 'little'), None)
+        self.dead_bytes += self._record_size(tombstone)
+
+    def _append(self, flag, payload, expires_at):
+        record = self._record(flag, payload, expires_at)
+        offset = self.end
+        self.file.write(record)
+        self.end += len(record)
+        return offset
+
+    def _record(self, flag, payload, expires_at):
+        return self.RECORD.pack(flag, len(payload), math.nan if expires_at is None else expires_at) + payload
+
+    def _header(self, offset):
+        if self.map is None or offset + self.RECORD.size > len(self.map):
+            self._remap()
+        return self.RECORD.unpack_from(self.map, offset)
+
+    def _record_size(self, offset):
+        return self.RECORD.size + self._header(offset)[1]
+
+    def _matches(self, offset, payload):
+        _, length, _ = self._header(offset)
+        start = offset + self.RECORD.size
+        return length == len(payload) and self.map[start:start + length] == payload
+
+    def _remap(self):
+        # records are written through the file object, so it is flushed before mapping them
+        self.file.flush()
+        self._unmap()
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _unmap(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+    def _maybe_compact(self):
+        if self.dead_bytes < self.compact_min_bytes or self.dead_bytes < self.compact_ratio * self.end:
+            return
+        if self.compactor is not None and self.compactor.is_alive():
+            return
+        self.compactor = threading.Thread(target=self._compact, daemon=True)
+        self.compactor.start()
+
+    def _compact(self):
+        """this function runs on the compaction thread. the live records are copied to a new file
+        without holding the lock (the part of an append only file that was already written never
+        changes), then the lock is taken to copy what was appended in the meantime and to swap
+        the new file in"""
+        with self.lock:
+            self.file.flush()
+            snapshot = dict(self.index)
+            snapshot_end = self.end
+        temp_path = self.path + '.compact'
+        copied = {}
+        position = 0
+        now = time.time()
+        try:
+            with open(self.path, 'rb') as source, open(temp_path, 'wb') as target:
+                with mmap.mmap(source.fileno(), snapshot_end, access=mmap.ACCESS_READ) as old:
+                    for key, offset in snapshot.items():
+                        _, length, expires_at = self.RECORD.unpack_from(old, offset)
+                        if expires_at <= now:
+                            # expired values are left behind, a NaN (no expiry) never compares as expired
+                            continue
+                        record = old[offset:offset + self.RECORD.size + length]
+                        target.write(record)
+                        copied[offset] = (key, position, len(record))
+                        position += len(record)
+            with self.lock:
+                self._remap()
+                index = {}
+                dead_bytes = 0
+                with open(temp_path, 'ab') as target:
+                    for key, offset in self.index.items():
+                        if offset >= snapshot_end:
+                            record = self.map[offset:offset + self._record_size(offset)]
+                            target.write(record)
+                            index[key] = position
+                            position += len(record)
+                        elif offset in copied:
+                            index[key] = copied.pop(offset)[1]
+                    # what is left in copied was removed or replaced while copying, so removed
+                    # values get a tombstone to keep them from coming back on the next load
+                    for key, _, length in copied.values():
+                        dead_bytes += length
+                        if key not in index:
+                            record = self._record(self.DEAD, key.to_bytes(8, 'little'), None)
+                            target.write(record)
+                            position += len(record)
+                            dead_bytes += len(record)
+                    target.flush()
+                    os.fsync(target.fileno())
+                self._unmap()
+                self.file.close()
+                os.replace(temp_path, self.path)
+                self.file = open(self.path, 'a+b')
+                self.end = position
+                self.index = index
+                self.dead_bytes = dead_bytes
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
 
 class LRUCache:
-    def __init__(self, capacity):
+    def __init__(self, capacity, ttl=None, clock=time.monotonic, resolution=1.0, disk=None):
         """this function creates a node colled front with a value 
         of none and a size of 0 while the capacity is the storage 
-        it would take up for the linked list"""
+        it would take up for the linked list. ttl is the default time to live
+        of a value in seconds (None means values never expire) and the clock
+        is used to read the current time. disk is an optional DiskTier that
+        keeps the values evicted from the linked list"""
         self.front = None
+        self.rear = None
+        self.nodes = {}
         self.size = 0
         self.capacity = capacity
+        self.ttl = ttl
+        self.clock = clock
+        self.timers = TimerWheel(clock(), resolution)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        self.disk = disk
+        self.listeners = []
+        self.sweep_generation = 0
+
+    def add_listener(self, listener):
+        """this function registers a function that is called as listener(event, value) on every
+        change of the linked list. the events are "insert" (a value is added at the front),
+        "promote" (a value already in the list moves to the front) and "evict" (a value leaves
+        the list because of the capacity, its time to live or remove_node)"""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def _notify(self, event, value):
+        for listener in self.listeners:
+            listener(event, value)
 
     def is_empty(self):
         return self.front is None
 
     def search(self, value):
-        """this function searches for a value in the linked list using while loop"""
-        current = self.front
-        while current is not None:
-            if current.value == value:
-                print("Value found: True")
-                return True
-            if current.next is None:
-                break
-            current = current.next
+        """this function searches for a value in the linked list using the dictionary of nodes
+        and the disk tier, a value that has expired counts as not found. searching does not
+        change the cache"""
+        node = self.nodes.get(value)
+        found = node is not None and (node.expires_at is None or node.expires_at > self.clock())
+        if not found and self.disk is not None:
+            found = value in self.disk
+        if found:
+            print("Value found: True")
+            return True
         print("Value not found: False")
         return False
 
-    def get(self, value):
+    def get(self, value, ttl=None):
         """this function gets a value form the user then checks if the value is in the linked list
-        if it is it removes the value and adds it to the front of the linked list"""
-        if self.search(value):
+        if it is it removes the value and adds it to the front of the linked list.
+        it returns True on a hit and False on a miss"""
+        now = self.clock()
+        self.expire(now)
+        node = self._lookup(value, now)
+        if node is not None:
+            self.hits += 1
+            if ttl is None:
+                self._promote(node)
+            else:
+                self._insert(value, self._expires_at(ttl, now), now)
+            return True
+        expires_at = self._expires_at(ttl, now)
+        if self.disk is not None and self._take_from_disk(value, now, None if ttl is None else expires_at):
+            self.hits += 1
+            return True
+        self.misses += 1
+        self._insert(value, expires_at, now, disk_checked=True)
+        return False
+
+    def get_many(self, values, ttl=None):
+        """this function does a get for every value in values but runs the expiry and reads
+        the clock once for the whole batch, it returns a list with True for every hit"""
+        now = self.clock()
+        self.expire(now)
+        expires_at = self._expires_at(ttl, now)
+        disk_expires_at = None if ttl is None else expires_at
+        lookup = self._lookup
+        results = []
+        for value in values:
+            node = lookup(value, now)
+            if node is not None:
+                self.hits += 1
+                if ttl is None:
+                    self._promote(node)
+                else:
+                    self._insert(value, expires_at, now)
+                results.append(True)
+            elif self.disk is not None and self._take_from_disk(value, now, disk_expires_at):
+                self.hits += 1
+                results.append(True)
+            else:
+                self.misses += 1
+                self._insert(value, expires_at, now, disk_checked=True)
+                results.append(False)
+        return results
+
+    def _lookup(self, value, now):
+        node = self.nodes.get(value)
+        if node is not None and node.expires_at is not None and node.expires_at <= now:
             self.remove_node(value)
-        self.put(value)
+            return None
+        return node
 
-    def put(self, value):
-        """this function adds a value to the front of the linked list"""
-        new_node = Node(value)
-        if self.is_empty():
-            self.front = new_node
-        else:
-            new_node.next = self.front
-            self.front = new_node
+    def _promote(self, node):
+        self._unlink(node)
+        self._push_front(node)
+        if self.listeners:
+            self._notify("promote", node.value)
+
+    def _take_from_disk(self, value, now, expires_at=None):
+        """this function moves a value from the disk tier to the front of the linked list and
+        returns True, or returns False when it is not there or has expired. expires_at replaces
+        the expiry time the value had on disk when it is given"""
+        stored = self.disk.take(value, DiskTier.MISSING)
+        if stored is DiskTier.MISSING:
+            return False
+        if stored is not None:
+            stored = now + stored - time.time()
+            if stored <= now:
+                return False
+        self.disk_hits += 1
+        # the new node is already at the front, with a capacity of 0 it may even be evicted
+        # again at once, so it is never promoted afterwards
+        self._insert(value, stored if expires_at is None else expires_at, now, disk_checked=True)
+        return True
+
+    def put(self, value, ttl=None):
+        """this function adds a value to the front of the linked list, ttl overrides the
+        default time to live of the cache for this value"""
+        now = self.clock()
+        self.expire(now)
+        self._insert(value, self._expires_at(ttl, now), now)
+
+    def put_many(self, values, ttl=None):
+        """this function does a put for every value in values with one expiry pass and
+        one read of the clock"""
+        now = self.clock()
+        self.expire(now)
+        expires_at = self._expires_at(ttl, now)
+        for value in values:
+            self._insert(value, expires_at, now)
+
+    def invalidate_many(self, values):
+        """this function removes every value in values from the linked list and the disk tier,
+        it returns how many of them were in the cache. a value whose time to live has passed
+        is removed too but not counted, the same as get and search treat it as absent"""
+        now = self.clock()
+        removed = 0
+        for value in values:
+            node = self.nodes.get(value)
+            if node is not None:
+                self.remove_node(value)
+                if node.expires_at is None or node.expires_at > now:
+                    removed += 1
+            elif self.disk is not None:
+                # the expiry times on disk are wall clock times
+                expires_at = self.disk.take(value, DiskTier.MISSING)
+                if expires_at is None or (expires_at is not DiskTier.MISSING and expires_at > time.time()):
+                    removed += 1
+        return removed
+
+    def _expires_at(self, ttl, now):
+        if ttl is None:
+            ttl = self.ttl
+        return None if ttl is None else now + ttl
+
+    def _insert(self, value, expires_at, now=None, disk_checked=False):
+        """disk_checked is True when the caller has already taken the value out of the disk tier"""
+        if value in self.nodes:
+            self.remove_node(value)
+        elif self.disk is not None and not disk_checked:
+            self.disk.take(value)
+        new_node = Node(value, expires_at)
+        self._push_front(new_node)
+        self.nodes[value] = new_node
         self.size += 1
+        if new_node.expires_at is not None:
+            self.timers.schedule(new_node)
+        if self.listeners:
+            self._notify("insert", value)
 
         """ this part of the code checks if the size of the linked list is greater than 
-        the capacity if so it would remove the last node in the linked list"""
+        the capacity if so it would remove the last node in the linked list and
+        move it to the disk tier if there is one"""
         if self.size > self.capacity:
-            current_node = self.front
-            previous_node = None
-            while current_node.next is not None:
-                previous_node = current_node
-                current_node = current_node.next
-
-            if previous_node:
-                previous_node.next = None
-            else:
-                self.front = None
-            self.size -= 1
+            evicted = self.rear
+            self.remove_node(evicted.value)
+            self.evictions += 1
+            if self.disk is not None:
+                self._spill(evicted, now)
+        return new_node
 
     def remove_node(self, value):
-        current_node = self.front
-        prev = None
-
-        while current_node is not None:
-            if current_node.value == value:
-                if prev is None:
-                    # Removing the front node
-                    self.front = current_node.next
-                else:
-                    # Removing a node in between or at the end
-                    prev.next = current_node.next
-                self.size -= 1
+        node = self.nodes.pop(value, None)
+        if node is None:
+            return
+        self._unlink(node)
+        self.timers.cancel(node)
+        self.size -= 1
+        if self.listeners:
+            self._notify("evict", value)
+
+    def expire(self, now=None):
+        """this function removes every value whose time to live has passed, it is called
+        on every get and put and by start_sweep to free memory when idle"""
+        if now is None:
+            now = self.clock()
+        for node in self.timers.advance(now):
+            self.remove_node(node.value)
+
+    def start_sweep(self, after):
+        """this function keeps calling expire every tick of the timer wheel so expired values
+        are freed even when nothing reads the cache. after is a function like the after method
+        of a tkinter widget, after(milliseconds, callback), so the sweep runs on the same
+        thread as the rest of the cache"""
+        self.sweep_generation += 1
+        generation = self.sweep_generation
+        interval = max(1, int(self.timers.resolution * 1000))
+
+        def sweep():
+            # a sweep started before the last start_sweep or stop_sweep call stops here
+            if generation == self.sweep_generation:
+                self.expire()
+                after(interval, sweep)
+
+        after(interval, sweep)
+
+    def stop_sweep(self):
+        self.sweep_generation += 1
+
+    def close(self):
+        """this function moves every value in the linked list to the disk tier and closes it,
+        so the next cache opened on the same file starts warm"""
+        if self.disk is None:
+            return
+        self.expire()
+        node = self.rear
+        while node is not None:
+            self._spill(node)
+            node = node.prev
+        self.disk.close()
+
+    def _spill(self, node, now=None):
+        expires_at = node.expires_at
+        if expires_at is not None:
+            if now is None:
+                now = self.clock()
+            if expires_at <= now:
                 return
-            prev = current_node
-            current_node = current_node.next
+            expires_at = time.time() + expires_at - now
+        self.disk.put(node.value, expires_at)
+
+    def _push_front(self, node):
+        node.prev = None
+        node.next = self.front
+        if self.front is not None:
+            self.front.prev = node
+        else:
+            self.rear = node
+        self.front = node
+
+    def _unlink(self, node):
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self.front = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self.rear = node.prev
+        node.prev = node.next = None
 
     def display(self):
         f = self.front
@@ -91,6 +617,173 @@ class LRUCache:
             f = f.next
         print("_______________________\n")
 
+class ArrayLRUCache:
+    """an LRU cache with the same get and put as LRUCache but without nodes. every value gets a
+    slot number, the previous and next links of the slots are kept in two preallocated arrays
+    of integers and a dictionary maps every value to its slot, so an entry costs a few array
+    items instead of a whole Node object. free slots are chained through the next array.
+    it has no time to live, disk tier or listeners"""
+    NIL = -1
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.prev = array('l', [self.NIL]) * capacity
+        self.next = array('l', range(1, capacity + 1))
+        if capacity:
+            self.next[capacity - 1] = self.NIL
+        self.values = [None] * capacity
+        self.slots = {}
+        self.front = self.NIL
+        self.rear = self.NIL
+        self.free = 0 if capacity else self.NIL
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def is_empty(self):
+        return self.size == 0
+
+    def get(self, value):
+        """this function moves a value to the front if it is in the cache or adds it if it is not,
+        it returns True on a hit and False on a miss"""
+        slot = self.slots.get(value)
+        if slot is None:
+            self.misses += 1
+            self._insert(value)
+            return False
+        self.hits += 1
+        if slot != self.front:
+            self._unlink(slot)
+            self._push_front(slot)
+        return True
+
+    def put(self, value):
+        """this function adds a value to the front of the cache"""
+        slot = self.slots.get(value)
+        if slot is None:
+            self._insert(value)
+        elif slot != self.front:
+            self._unlink(slot)
+            self._push_front(slot)
+
+    def remove_node(self, value):
+        slot = self.slots.pop(value, None)
+        if slot is None:
+            return
+        self._unlink(slot)
+        self.values[slot] = None
+        self.next[slot] = self.free
+        self.free = slot
+        self.size -= 1
+
+    def get_many(self, values):
+        """this function does a get for every value in values, the loop works on local names
+        and inlines the link updates, it returns a list with True for every hit"""
+        slots = self.slots
+        prev_links = self.prev
+        next_links = self.next
+        nil = self.NIL
+        results = []
+        hits = 0
+        for value in values:
+            slot = slots.get(value)
+            if slot is None:
+                self._insert(value)
+                results.append(False)
+                continue
+            hits += 1
+            front = self.front
+            if slot != front:
+                # unlink the slot (it is not the front so it has a previous slot)
+                before = prev_links[slot]
+                after = next_links[slot]
+                next_links[before] = after
+                if after != nil:
+                    prev_links[after] = before
+                else:
+                    self.rear = before
+                # and push it in front of the old front
+                prev_links[slot] = nil
+                next_links[slot] = front
+                prev_links[front] = slot
+                self.front = slot
+            results.append(True)
+        self.hits += hits
+        self.misses += len(results) - hits
+        return results
+
+    def put_many(self, values):
+        """this function does a put for every value in values"""
+        put = self.put
+        for value in values:
+            put(value)
+
+    def invalidate_many(self, values):
+        """this function removes every value in values, it returns how many of them were in the cache"""
+        removed = 0
+        slots = self.slots
+        for value in values:
+            if value in slots:
+                self.remove_node(value)
+                removed += 1
+        return removed
+
+    def items(self):
+        """this function returns the values from the front to the rear"""
+        result = []
+        slot = self.front
+        while slot != self.NIL:
+            result.append(self.values[slot])
+            slot = self.next[slot]
+        return result
+
+    def _insert(self, value):
+        if self.free == self.NIL:
+            if self.capacity == 0:
+                self.evictions += 1
+                return
+            # every slot is in use so the rear slot is evicted and reused
+            slot = self.rear
+            del self.slots[self.values[slot]]
+            self._unlink(slot)
+            self.evictions += 1
+        else:
+            slot = self.free
+            self.free = self.next[slot]
+            self.size += 1
+        self.values[slot] = value
+        self.slots[value] = slot
+        self._push_front(slot)
+
+    def _push_front(self, slot):
+        self.prev[slot] = self.NIL
+        self.next[slot] = self.front
+        if self.front != self.NIL:
+            self.prev[self.front] = slot
+        else:
+            self.rear = slot
+        self.front = slot
+
+    def _unlink(self, slot):
+        before = self.prev[slot]
+        after = self.next[slot]
+        if before != self.NIL:
+            self.next[before] = after
+        else:
+            self.front = after
+        if after != self.NIL:
+            self.prev[after] = before
+        else:
+            self.rear = before
+
+    def display(self):
+        print("LRU Cache starts here")
+        print("_______________________")
+        for value in self.items():
+            print(value)
+        print("_______________________\n")
+
 def add_word():
     """this function adds a word to the linked list 
     it also checks if the capacity is set or not if not raises error message"""
@@ -99,76 +792,121 @@ def add_word():
         return
     word = entry.get()
     lru_cache.get(word)
-    lru_cache.display()
-    update_table()
 
 def set_capacity():
-    """this function sets the capacity of the linked list"""
+    """this function sets the capacity and the time to live (optional, in seconds) of the linked list,
+    with a time to live the cache is swept every second so expired words leave the table"""
     global lru_cache
     try:
         cap = int(capacity_entry.get())
-        lru_cache = LRUCache(cap)
+        ttl = float(ttl_entry.get()) if ttl_entry.get().strip() else None
+        lru_cache = LRUCache(cap, ttl)
         capacity_entry.config(state='disabled')
+        ttl_entry.config(state='disabled')
         set_capacity_button.config(state='disabled')
         create_table(cap)
+        lru_cache.add_listener(on_cache_event)
+        if ttl is not None:
+            lru_cache.start_sweep(root.after)
     except ValueError:
-        messagebox.showerror("Error", "Please enter a valid capacity")
+        messagebox.showerror("Error", "Please enter a valid capacity and time to live")
 
 def reset():
     """this function resets the linked list and the table"""
     global lru_cache
+    if lru_cache is not None:
+        lru_cache.stop_sweep()
     lru_cache = None
     capacity_entry.config(state='normal')
     capacity_entry.delete(0, tk.END)
+    ttl_entry.config(state='normal')
+    ttl_entry.delete(0, tk.END)
     set_capacity_button.config(state='normal')
-    for i in table.get_children():
-        table.delete(i)
+    pending_events.clear()
+    rows.clear()
+    if table is not None:
+        for i in table.get_children():
+            table.delete(i)
 
 def create_table(capacity):
-    """creates a table with the capacity of the linked list"""
-    global table
-    table = ttk.Treeview(UI_frame, columns=["0"], show='headings', height=capacity)
+    """creates a table with the capacity of the linked list, the table shows at most
+    20 rows at a time and scrolls through the rest. the table of the last capacity is destroyed"""
+    global table, scrollbar
+    if table is not None:
+        table.destroy()
+        scrollbar.destroy()
+    table = ttk.Treeview(UI_frame, columns=["0"], show='headings', height=min(capacity, 20))
     table.heading("0", text="LRU Cache")
     table.column("0", width=100)
     table.grid(row=2, column=0, columnspan=3, padx=10, pady=10)
+    scrollbar = ttk.Scrollbar(UI_frame, orient='vertical', command=table.yview)
+    scrollbar.grid(row=2, column=3, sticky='ns', pady=10)
+    table.configure(yscrollcommand=scrollbar.set)
+    pending_events.clear()
+    rows.clear()
+
+def on_cache_event(event, value):
+    """this function is called by the cache on every change, the changes are collected
+    and the table is updated once when tkinter is idle instead of after every change"""
+    global update_scheduled
+    pending_events.append((event, value))
+    if not update_scheduled:
+        update_scheduled = True
+        root.after_idle(update_table)
 
 def update_table():
-    """updates the tables on every entery of nodes"""
-    global table
-    for i in table.get_children():
-        table.delete(i)
-    values = []
-    current = lru_cache.front
-    while current is not None:
-        values.append(current.value)
-        current = current.next
-    for value in values:
-        table.insert('', 'end', values=[value])
+    """updates only the rows of the table that the collected cache events changed,
+    rows keeps the table row of every value in the cache"""
+    global update_scheduled
+    update_scheduled = False
+    events = pending_events[:]
+    pending_events.clear()
+    for event, value in events:
+        if event == "insert":
+            rows[value] = table.insert('', 0, values=[value])
+        elif event == "promote":
+            table.move(rows[value], '', 0)
+        elif event == "evict":
+            table.delete(rows.pop(value))
 
-root = tk.Tk()
-root.title('LRU Cache')
-root.maxsize(1000, 900)
+lru_cache = None
+table = None
+scrollbar = None
+rows = {}
+pending_events = []
+update_scheduled = False
 
-UI_frame = tk.Frame(root, width=600, height=200, bg='light grey')
-UI_frame.pack(padx=10, pady=10)
+if __name__ == "__main__":
+    # tkinter is only imported to run the app, so the cache classes can be used without it
+    import tkinter as tk
+    from tkinter import ttk
+    from tkinter import messagebox
 
-tk.Label(UI_frame, text="Please enter a word: ", bg='light grey').grid(row=0, column=0, padx=10, pady=5)
-entry = tk.Entry(UI_frame)
-entry.grid(row=0, column=1, padx=10, pady=5)
+    root = tk.Tk()
+    root.title('LRU Cache')
+    root.maxsize(1000, 900)
 
-tk.Label(UI_frame, text="Please enter capacity: ", bg='light grey').grid(row=1, column=0, padx=10, pady=5)
-capacity_entry = tk.Entry(UI_frame)
-capacity_entry.grid(row=1, column=1, padx=10, pady=5)
+    UI_frame = tk.Frame(root, width=600, height=200, bg='light grey')
+    UI_frame.pack(padx=10, pady=10)
 
-set_capacity_button = tk.Button(UI_frame, text="Set Capacity", command=set_capacity)
-set_capacity_button.grid(row=1, column=2, padx=10, pady=5)
+    tk.Label(UI_frame, text="Please enter a word: ", bg='light grey').grid(row=0, column=0, padx=10, pady=5)
+    entry = tk.Entry(UI_frame)
+    entry.grid(row=0, column=1, padx=10, pady=5)
 
-tk.Button(UI_frame, text="Search", command=add_word).grid(row=0, column=2, padx=10, pady=5)
+    tk.Label(UI_frame, text="Please enter capacity: ", bg='light grey').grid(row=1, column=0, padx=10, pady=5)
+    capacity_entry = tk.Entry(UI_frame)
+    capacity_entry.grid(row=1, column=1, padx=10, pady=5)
 
-reset_button = tk.Button(UI_frame, text="Reset", command=reset)
-reset_button.grid(row=3, column=2, padx=10, pady=5)
+    tk.Label(UI_frame, text="Time to live (seconds, optional): ", bg='light grey').grid(row=3, column=0, padx=10, pady=5)
+    ttl_entry = tk.Entry(UI_frame)
+    ttl_entry.grid(row=3, column=1, padx=10, pady=5)
 
-lru_cache = None
+    set_capacity_button = tk.Button(UI_frame, text="Set Capacity", command=set_capacity)
+    set_capacity_button.grid(row=1, column=2, padx=10, pady=5)
+
+    tk.Button(UI_frame, text="Search", command=add_word).grid(row=0, column=2, padx=10, pady=5)
+
+    reset_button = tk.Button(UI_frame, text="Reset", command=reset)
+    reset_button.grid(row=3, column=2, padx=10, pady=5)
 
-if __name__ == "__main__":
     root.mainloop()
\ No newline at end of file
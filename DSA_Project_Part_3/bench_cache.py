@@ -0,0 +1,71 @@
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+
+from LRU_Cache import LRUCache, ArrayLRUCache
+
+
+def memory_per_entry(make_cache, keys):
+    """this function fills a new cache with keys and returns the bytes it allocated per entry,
+    the keys are created before tracing so only the cache itself is measured"""
+    tracemalloc.start()
+    cache = make_cache(len(keys))
+    cache.put_many(keys)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cache
+    return used / len(keys)
+
+
+def throughput(make_cache, capacity, trace, batch_size):
+    """this function returns the accesses per second of single get calls and of get_many
+    calls with batches of batch_size"""
+    cache = make_cache(capacity)
+    get = cache.get
+    start = time.perf_counter()
+    for key in trace:
+        get(key)
+    single = len(trace) / (time.perf_counter() - start)
+
+    cache = make_cache(capacity)
+    batches = [trace[i:i + batch_size] for i in range(0, len(trace), batch_size)]
+    start = time.perf_counter()
+    for batch in batches:
+        cache.get_many(batch)
+    batched = len(trace) / (time.perf_counter() - start)
+    return single, batched
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compares the memory and speed of LRUCache and ArrayLRUCache")
+    parser.add_argument('--entries', type=int, default=1_000_000, help="number of entries for the memory test")
+    parser.add_argument('--capacity', type=int, default=100_000, help="capacity for the speed test")
+    parser.add_argument('--accesses', type=int, default=1_000_000, help="number of accesses for the speed test")
+    parser.add_argument('--batch', type=int, default=1000, help="size of one get_many batch")
+    args = parser.parse_args(argv)
+
+    caches = [('LRUCache', LRUCache), ('ArrayLRUCache', ArrayLRUCache)]
+    keys = list(range(args.entries))
+    random.seed(0)
+    # a skewed trace over four times the capacity so there are hits, misses and evictions
+    trace = [int(random.paretovariate(1.0) * args.capacity / 4) % (4 * args.capacity)
+             for _ in range(args.accesses)]
+
+    # the batching speedup compares get_many with get on the same cache and the layout speedup
+    # compares get of each cache with get of LRUCache, so the two effects are reported apart
+    print(f"{'cache':<15}{'bytes/entry':>13}{'get/s':>14}{'get_many/s':>14}{'batching':>10}{'layout':>8}")
+    baseline = None
+    for name, make_cache in caches:
+        per_entry = memory_per_entry(make_cache, keys)
+        single, batched = throughput(make_cache, args.capacity, trace, args.batch)
+        if baseline is None:
+            baseline = single
+        print(f"{name:<15}{per_entry:>13.1f}{single:>14,.0f}{batched:>14,.0f}"
+              f"{batched / single:>9.2f}x{single / baseline:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+import argparse
+import sys
+import time
+
+from LRU_Cache import LRUCache
+
+# struct codes for the fixed width keys of a binary trace
+BINARY_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+def read_text_trace(path):
+    """this function reads a text trace line by line and yields every word in it as one access"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as file:
+        for line in file:
+            yield from line.split()
+
+
+def read_binary_trace(path, width=8, chunk_size=1 << 20):
+    """this function reads a binary trace made of fixed width unsigned integers in the byte
+    order of this machine and yields every integer as one access, the file is read in chunks
+    so large traces are never loaded into memory at once"""
+    code = BINARY_FORMATS[width]
+    chunk_size -= chunk_size % width
+    with open(path, 'rb') as file:
+        while chunk := file.read(chunk_size):
+            usable = len(chunk) - len(chunk) % width
+            yield from memoryview(chunk)[:usable].cast(code)
+
+
+def simulate(trace, capacity):
+    """this function replays a trace through an LRUCache and returns the hits, misses,
+    evictions and the number of accesses per second"""
+    cache = LRUCache(capacity)
+    get = cache.get
+    start = time.perf_counter()
+    for key in trace:
+        get(key)
+    elapsed = time.perf_counter() - start
+    accesses = cache.hits + cache.misses
+    return {
+        'accesses': accesses,
+        'hits': cache.hits,
+        'misses': cache.misses,
+        'evictions': cache.evictions,
+        'hit_ratio': cache.hits / accesses if accesses else 0.0,
+        'seconds': elapsed,
+        'throughput': accesses / elapsed if elapsed else float('inf'),
+    }
+
+
+class FenwickTree:
+    """a binary indexed tree over the positions of the accesses of a trace, a position holds 1 while
+    it is the latest access of its key so a prefix sum counts how many distinct keys were seen up to it"""
+
+    def __init__(self, size):
+        self.tree = [0] * (size + 1)
+
+    def __len__(self):
+        return len(self.tree) - 1
+
+    def add(self, position, amount):
+        i = position + 1
+        tree = self.tree
+        size = len(tree)
+        while i < size:
+            tree[i] += amount
+            i += i & -i
+
+    def prefix_sum(self, position):
+        """this function returns the sum of the positions 0 to position (inclusive)"""
+        i = position + 1
+        tree = self.tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+def stack_distances(trace):
+    """this function computes the Mattson stack distance of every access in one pass, the
+    distance of an access is the number of distinct keys used since the last access to the
+    same key (itself included), an LRU cache of capacity c hits exactly the accesses whose
+    distance is at most c. it returns a histogram of the distances (index 0 is unused), the
+    number of cold misses and the number of accesses"""
+    histogram = [0]
+    last_seen = {}
+    tree = FenwickTree(1024)
+    cold_misses = 0
+    accesses = 0
+    position = 0
+    for key in trace:
+        if position == len(tree):
+            # only the latest position of every key matters, so when the tree is full they are
+            # renumbered 0 to K-1 in the same order and the tree is rebuilt with room for K more,
+            # this keeps its size proportional to the number of distinct keys, not the trace
+            order = sorted(last_seen, key=last_seen.get)
+            tree = FenwickTree(max(1024, 2 * len(order)))
+            for position, seen in enumerate(order):
+                last_seen[seen] = position
+                tree.add(position, 1)
+            position = len(order)
+        previous = last_seen.get(key)
+        if previous is None:
+            cold_misses += 1
+        else:
+            distance = len(last_seen) - tree.prefix_sum(previous) + 1
+            if distance >= len(histogram):
+                histogram.extend([0] * (distance + 1 - len(histogram)))
+            histogram[distance] += 1
+            tree.add(previous, -1)
+        tree.add(position, 1)
+        last_seen[key] = position
+        position += 1
+        accesses += 1
+    return histogram, cold_misses, accesses
+
+
+def miss_ratio_curve(trace):
+    """this function returns the LRU miss ratio for every capacity at once, curve[c] is the
+    miss ratio of a cache that holds c values, capacities past the end of the list have the
+    same miss ratio as the last one (only cold misses are left)"""
+    histogram, cold_misses, accesses = stack_distances(trace)
+    curve = []
+    misses = accesses
+    for hits in histogram:
+        misses -= hits
+        curve.append(misses / accesses if accesses else 0.0)
+    return curve
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replays an access trace through the LRU cache")
+    parser.add_argument('trace', help="text trace (whitespace separated words) or binary trace")
+    parser.add_argument('--capacity', type=int, default=100, help="capacity of the simulated cache")
+    parser.add_argument('--binary', action='store_true', help="read the trace as fixed width integers")
+    parser.add_argument('--width', type=int, choices=sorted(BINARY_FORMATS), default=8,
+                        help="size in bytes of one key of a binary trace")
+    parser.add_argument('--mrc', action='store_true', help="also compute the miss ratio curve")
+    parser.add_argument('--mrc-out', help="write the whole miss ratio curve to this csv file")
+    parser.add_argument('--points', type=int, default=20, help="number of curve points to print")
+    args = parser.parse_args(argv)
+
+    def trace():
+        if args.binary:
+            return read_binary_trace(args.trace, args.width)
+        return read_text_trace(args.trace)
+
+    stats = simulate(trace(), args.capacity)
+    print(f"capacity    {args.capacity}")
+    print(f"accesses    {stats['accesses']}")
+    print(f"hits        {stats['hits']} ({stats['hit_ratio']:.2%})")
+    print(f"misses      {stats['misses']}")
+    print(f"evictions   {stats['evictions']}")
+    print(f"throughput  {stats['throughput']:,.0f} accesses/s ({stats['seconds']:.3f} s)")
+
+    if args.mrc or args.mrc_out:
+        start = time.perf_counter()
+        curve = miss_ratio_curve(trace())
+        elapsed = time.perf_counter() - start
+        print(f"\nmiss ratio curve ({len(curve) - 1} capacities in {elapsed:.3f} s)")
+        step = max(1, (len(curve) - 1) // max(1, args.points))
+        for capacity in range(step, len(curve), step):
+            print(f"{capacity:>10}  {curve[capacity]:.4f}")
+        if args.mrc_out:
+            with open(args.mrc_out, 'w') as file:
+                file.write("capacity,miss_ratio\n")
+                for capacity, ratio in enumerate(curve):
+                    file.write(f"{capacity},{ratio}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import threading
+import time
+
+from LRU_Cache import DiskTier, LRUCache
+
+
+def linked_values(cache):
+    values = []
+    node = cache.front
+    while node is not None:
+        values.append(node.value)
+        node = node.next
+    return values
+
+
+def test_restart_replays_puts_and_tombstones(tmp_path):
+    path = str(tmp_path / "cache.bin")
+    disk = DiskTier(path)
+    for value in ["a", "b", "c", "d"]:
+        disk.put(value)
+    disk.put("a")
+    assert disk.take("b") is None
+    disk.close()
+
+    disk = DiskTier(path)
+    assert len(disk) == 3
+    assert "a" in disk and "c" in disk and "d" in disk
+    assert "b" not in disk
+    disk.close()
+
+
+def test_partial_record_is_truncated(tmp_path):
+    path = tmp_path / "cache.bin"
+    disk = DiskTier(str(path))
+    disk.put("a")
+    disk.put("b")
+    disk.close()
+    size = path.stat().st_size
+    with open(path, "ab") as file:
+        file.write(DiskTier.RECORD.pack(DiskTier.LIVE, 100, 0.0)[:7])
+
+    disk = DiskTier(str(path))
+    assert len(disk) == 2
+    assert path.stat().st_size == size
+    disk.put("c")
+    disk.close()
+    disk = DiskTier(str(path))
+    assert len(disk) == 3 and "c" in disk
+    disk.close()
+
+
+def test_ttl_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.bin")
+    now = [0.0]
+    cache = LRUCache(10, clock=lambda: now[0], disk=DiskTier(path))
+    cache.put("long", ttl=100)
+    cache.put("short", ttl=0.01)
+    cache.put("forever")
+    cache.close()
+    time.sleep(0.05)
+
+    # the monotonic clock of the next run starts somewhere else, the wall clock carries the ttl over
+    now[0] = 5000.0
+    cache = LRUCache(10, clock=lambda: now[0], disk=DiskTier(path))
+    assert cache.get("long")
+    assert 5000.0 + 90 < cache.nodes["long"].expires_at <= 5000.0 + 100
+    assert cache.get("forever") and cache.nodes["forever"].expires_at is None
+    assert not cache.get("short")
+    cache.close()
+
+
+def test_put_and_take_during_compaction(tmp_path):
+    path = str(tmp_path / "cache.bin")
+    disk = DiskTier(path, compact_min_bytes=1 << 40)
+    for i in range(20000):
+        disk.put(i)
+    for i in range(0, 20000, 2):
+        disk.take(i)
+    disk.put("expired", time.time() - 1)
+    live = set(range(1, 20000, 2))
+
+    compactor = threading.Thread(target=disk._compact)
+    compactor.start()
+    i = 0
+    while compactor.is_alive() or i < 2000:
+        if i % 3:
+            disk.put(20000 + i)
+            live.add(20000 + i)
+        elif disk.take(1 + 2 * i, DiskTier.MISSING) is not DiskTier.MISSING:
+            live.discard(1 + 2 * i)
+        i += 1
+    compactor.join()
+
+    # the expired record is dropped by the compaction and is a plain miss afterwards
+    assert disk.take("expired", DiskTier.MISSING) is DiskTier.MISSING
+    assert all(value in disk for value in live)
+    index = dict(disk.index)
+    disk.close()
+
+    disk = DiskTier(path)
+    assert disk.index == index
+    assert len(disk) == len(live)
+    disk.close()
+
+
+def test_disk_hit_with_zero_capacity(tmp_path):
+    cache = LRUCache(0, disk=DiskTier(str(tmp_path / "cache.bin")))
+    cache.put("a")
+    assert cache.get("a")
+    for i in range(100):
+        cache.put(i)
+    assert cache.size == 0 and cache.nodes == {} and linked_values(cache) == []
+    cache.close()
+
+
+def test_disk_hit_is_inserted_once_and_a_miss_takes_once(tmp_path):
+    cache = LRUCache(1, disk=DiskTier(str(tmp_path / "cache.bin")))
+    cache.put("a")
+    cache.put("b")
+    events = []
+    cache.add_listener(lambda event, value: events.append((event, value)))
+    assert cache.get("a")
+    assert events == [("insert", "a"), ("evict", "b")]
+    assert linked_values(cache) == ["a"]
+
+    takes = []
+    take = cache.disk.take
+    cache.disk.take = lambda value, default=None: takes.append(value) or take(value, default)
+    assert not cache.get("c")
+    assert cache.get_many(["d", "b"]) == [False, True]
+    assert takes == ["c", "d", "b"]
+    cache.close()